@@ -1,7 +1,9 @@
 package cli
 
 import (
+	"bufio"
 	"fmt"
+	"os"
 
 	"github.com/spf13/cobra"
 )
@@ -28,20 +30,28 @@ func runList(cmd *cobra.Command, args []string) error {
 		return nil
 	}
 
-	fmt.Printf("Found %d pattern(s):\n\n", len(patterns))
+	// Buffer the listing so each line doesn't issue its own write to
+	// stdout; the whole table goes out in a handful of flushes
+	out := bufio.NewWriter(os.Stdout)
+	defer out.Flush()
 
-	for _, p := range patterns {
+	fmt.Fprintf(out, "Found %d pattern(s):\n\n", len(patterns))
+
+	// Iterate by index; ThreatPattern is a large struct and a value range
+	// would copy every pattern just to print a few fields
+	for i := range patterns {
+		p := &patterns[i]
 		if verbose {
-			fmt.Printf("[%s] %s\n", p.Tier, p.ID)
-			fmt.Printf("  Name:     %s\n", p.Name)
-			fmt.Printf("  Category: %s > %s\n", p.Category, p.Subcategory)
-			fmt.Printf("  Severity: %s | Likelihood: %s\n", p.Severity, p.Likelihood)
-			fmt.Printf("  Language: %s | Framework: %s\n", p.Language, p.Framework)
-			fmt.Println()
+			fmt.Fprintf(out, "[%s] %s\n", p.Tier, p.ID)
+			fmt.Fprintf(out, "  Name:     %s\n", p.Name)
+			fmt.Fprintf(out, "  Category: %s > %s\n", p.Category, p.Subcategory)
+			fmt.Fprintf(out, "  Severity: %s | Likelihood: %s\n", p.Severity, p.Likelihood)
+			fmt.Fprintf(out, "  Language: %s | Framework: %s\n", p.Language, p.Framework)
+			fmt.Fprintln(out)
 		} else {
-			fmt.Printf("%s  %-20s  %s\n", p.ID, fmt.Sprintf("[%s/%s]", p.Severity, p.Tier), p.Name)
+			fmt.Fprintf(out, "%s  %-20s  %s\n", p.ID, fmt.Sprintf("[%s/%s]", p.Severity, p.Tier), p.Name)
 		}
 	}
 
-	return nil
+	return out.Flush()
 }
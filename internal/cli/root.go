@@ -47,6 +47,14 @@ Examples:
 			return nil
 		}
 
+		// Shell completion never consults the index either; skip the pattern
+		// load so completion requests stay instant
+		if cmd.Name() == "completion" || cmd.Name() == cobra.ShellCompRequestCmd ||
+			cmd.Name() == cobra.ShellCompNoDescRequestCmd ||
+			(cmd.Parent() != nil && cmd.Parent().Name() == "completion") {
+			return nil
+		}
+
 		// Initialize loader and index
 		loader = knowledge.NewLoader(patternsDir)
 		index = knowledge.NewIndex()
@@ -92,10 +100,10 @@ func init() {
 
 // findPatternsDir locates the patterns directory
 func findPatternsDir() string {
-	// Check common locations
+	// Check common locations; "patterns" already covers "./patterns",
+	// so each candidate costs exactly one stat
 	candidates := []string{
 		"patterns",
-		"./patterns",
 		filepath.Join(os.Getenv("HOME"), ".tmkb", "patterns"),
 		"/usr/local/share/tmkb/patterns",
 	}
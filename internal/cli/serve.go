@@ -5,6 +5,7 @@ import (
 	"log"
 	"os"
 
+	"github.com/mark-chris/tmkb/internal/knowledge"
 	"github.com/mark-chris/tmkb/internal/mcp"
 	"github.com/spf13/cobra"
 )
@@ -27,6 +28,10 @@ func runServe(cmd *cobra.Command, args []string) error {
 	// Create MCP server with the loaded pattern index
 	server := mcp.NewServer(index)
 
+	// Warm the token counter now so the first query doesn't pay the
+	// one-time encoder construction cost
+	knowledge.WarmTokenCounter()
+
 	// Log to stderr (stdout is reserved for protocol communication)
 	log.SetOutput(os.Stderr)
 	log.Printf("Starting MCP server with %d patterns loaded", index.Count())
@@ -3,6 +3,7 @@ package testutil
 import (
 	"os"
 	"path/filepath"
+	"sync"
 	"testing"
 
 	"github.com/mark-chris/tmkb/internal/knowledge"
@@ -22,6 +23,46 @@ type PatternWrapper struct {
 	ThreatPattern knowledge.ThreatPattern `yaml:"threat_pattern"`
 }
 
+// standardFixtureYAML caches the standard test patterns and their marshaled
+// YAML; the fixture set is identical for every test, so the patterns are
+// built and serialized once per test binary instead of once per test
+var (
+	standardFixtureOnce sync.Once
+	standardPatterns    []knowledge.ThreatPattern
+	standardYAML        map[string][]byte // filename -> marshaled pattern
+	standardFixtureErr  error
+)
+
+func standardFixture() ([]knowledge.ThreatPattern, map[string][]byte, error) {
+	standardFixtureOnce.Do(func() {
+		patterns := []knowledge.ThreatPattern{
+			CreateTestPattern("TMKB-TEST-001", "Test Pattern 001", "Python", "Flask"),
+			CreateTestPattern("TMKB-TEST-002", "Test Pattern 002", "Go", "any"),
+			CreateTestPattern("TMKB-TEST-003", "Test Pattern 003", "JavaScript", "Express"),
+		}
+
+		// Set specific keywords for each pattern as required
+		patterns[0].Triggers.Keywords = []string{"background", "job", "authorization"}
+		patterns[1].Triggers.Keywords = []string{"session", "token"}
+		patterns[2].Triggers.Keywords = []string{"tenant", "isolation"}
+
+		yamlByName := make(map[string][]byte, len(patterns))
+		for _, pattern := range patterns {
+			wrapper := PatternWrapper{ThreatPattern: pattern}
+			data, err := yaml.Marshal(&wrapper)
+			if err != nil {
+				standardFixtureErr = err
+				return
+			}
+			yamlByName[pattern.ID+".yaml"] = data
+		}
+
+		standardPatterns = patterns
+		standardYAML = yamlByName
+	})
+	return standardPatterns, standardYAML, standardFixtureErr
+}
+
 // SetupTestPatterns creates a temporary directory with 3 test patterns
 // It returns a TestFixture with the directory path, loaded patterns, and cleanup function
 func SetupTestPatterns(t *testing.T) *TestFixture {
@@ -30,21 +71,15 @@ func SetupTestPatterns(t *testing.T) *TestFixture {
 	// Create temporary directory
 	tmpDir := t.TempDir()
 
-	// Create test patterns
-	patterns := []knowledge.ThreatPattern{
-		CreateTestPattern("TMKB-TEST-001", "Test Pattern 001", "Python", "Flask"),
-		CreateTestPattern("TMKB-TEST-002", "Test Pattern 002", "Go", "any"),
-		CreateTestPattern("TMKB-TEST-003", "Test Pattern 003", "JavaScript", "Express"),
+	patterns, yamlByName, err := standardFixture()
+	if err != nil {
+		t.Fatalf("Failed to marshal test patterns: %v", err)
 	}
 
-	// Set specific keywords for each pattern as required
-	patterns[0].Triggers.Keywords = []string{"background", "job", "authorization"}
-	patterns[1].Triggers.Keywords = []string{"session", "token"}
-	patterns[2].Triggers.Keywords = []string{"tenant", "isolation"}
-
-	// Write patterns to disk
-	for _, pattern := range patterns {
-		if err := writePatternFile(tmpDir, pattern); err != nil {
+	// Write the pre-serialized patterns to disk
+	for name, data := range yamlByName {
+		// #nosec G306 -- Test files don't need restrictive permissions
+		if err := os.WriteFile(filepath.Join(tmpDir, name), data, 0644); err != nil {
 			t.Fatalf("Failed to write pattern file: %v", err)
 		}
 	}
@@ -103,8 +138,8 @@ func CreateTestPattern(id, name, language, framework string) knowledge.ThreatPat
 	}
 }
 
-// writePatternFile writes a threat pattern to a YAML file in the specified directory
-func writePatternFile(dir string, pattern knowledge.ThreatPattern) error {
+// WritePatternFile writes a threat pattern to a YAML file in the specified directory
+func WritePatternFile(dir string, pattern knowledge.ThreatPattern) error {
 	// Wrap pattern in threat_pattern key
 	wrapper := PatternWrapper{ThreatPattern: pattern}
 
@@ -1,6 +1,7 @@
 package cli
 
 import (
+	"bufio"
 	"fmt"
 	"os"
 
@@ -54,7 +55,11 @@ func runValidate(cmd *cobra.Command, args []string) error {
 	// Validate
 	results := knowledge.ValidateAll(patterns)
 
-	// Output results
+	// Output results. Buffered so per-pattern findings go out in a few
+	// writes rather than one per line; flushed explicitly below because
+	// the error path exits without running deferred calls
+	out := bufio.NewWriter(os.Stdout)
+
 	hasErrors := false
 	totalErrors := 0
 	totalWarnings := 0
@@ -73,24 +78,28 @@ func runValidate(cmd *cobra.Command, args []string) error {
 			if !result.IsValid {
 				status = "✗"
 			}
-			fmt.Printf("%s %s\n", status, result.PatternID)
+			fmt.Fprintf(out, "%s %s\n", status, result.PatternID)
 
 			for _, err := range result.Errors {
-				fmt.Printf("  ERROR: %s - %s\n", err.Field, err.Message)
+				fmt.Fprintf(out, "  ERROR: %s - %s\n", err.Field, err.Message)
 			}
 			for _, warn := range result.Warnings {
-				fmt.Printf("  WARN:  %s - %s\n", warn.Field, warn.Message)
+				fmt.Fprintf(out, "  WARN:  %s - %s\n", warn.Field, warn.Message)
 			}
 			if len(result.Errors) > 0 || len(result.Warnings) > 0 {
-				fmt.Println()
+				fmt.Fprintln(out)
 			}
 		}
 	}
 
 	// Summary
-	fmt.Printf("\nValidated %d pattern(s): %d error(s), %d warning(s)\n",
+	fmt.Fprintf(out, "\nValidated %d pattern(s): %d error(s), %d warning(s)\n",
 		len(results), totalErrors, totalWarnings)
 
+	if err := out.Flush(); err != nil {
+		return err
+	}
+
 	if hasErrors {
 		os.Exit(1)
 	}
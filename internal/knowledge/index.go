@@ -13,7 +13,20 @@ type Index struct {
 	byKeyword   map[string][]*ThreatPattern
 	byFramework map[string][]*ThreatPattern
 	byLanguage  map[string][]*ThreatPattern
-	mu          sync.RWMutex
+
+	// keywordSets holds each pattern's lowercased trigger keywords as a set,
+	// keyed by pattern ID, so relevance scoring does not rebuild it per query
+	keywordSets map[string]map[string]bool
+
+	// all is the pointer view of patterns, maintained at build time so
+	// queries do not rebuild it on every call
+	all []*ThreatPattern
+
+	// actionsLower holds each pattern's action triggers pre-lowercased,
+	// aligned with patterns by position, for context matching
+	actionsLower [][]string
+
+	mu sync.RWMutex
 }
 
 // NewIndex creates a new empty index
@@ -25,6 +38,7 @@ func NewIndex() *Index {
 		byKeyword:   make(map[string][]*ThreatPattern),
 		byFramework: make(map[string][]*ThreatPattern),
 		byLanguage:  make(map[string][]*ThreatPattern),
+		keywordSets: make(map[string]map[string]bool),
 	}
 }
 
@@ -36,16 +50,29 @@ func (idx *Index) Build(patterns []ThreatPattern) {
 	// Store patterns
 	idx.patterns = patterns
 
-	// Clear maps
-	idx.byID = make(map[string]*ThreatPattern)
-	idx.byCategory = make(map[string][]*ThreatPattern)
-	idx.byKeyword = make(map[string][]*ThreatPattern)
-	idx.byFramework = make(map[string][]*ThreatPattern)
-	idx.byLanguage = make(map[string][]*ThreatPattern)
+	// Clear maps, sized for the incoming pattern count so inserts below
+	// don't trigger incremental rehashing; byID and keywordSets get exactly
+	// one entry per pattern, the others at most that many buckets
+	idx.byID = make(map[string]*ThreatPattern, len(patterns))
+	idx.byCategory = make(map[string][]*ThreatPattern, len(patterns))
+	idx.byKeyword = make(map[string][]*ThreatPattern, len(patterns))
+	idx.byFramework = make(map[string][]*ThreatPattern, len(patterns))
+	idx.byLanguage = make(map[string][]*ThreatPattern, len(patterns))
+	idx.keywordSets = make(map[string]map[string]bool, len(patterns))
+	idx.all = make([]*ThreatPattern, len(patterns))
+	idx.actionsLower = make([][]string, len(patterns))
 
 	// Build indexes
 	for i := range idx.patterns {
 		p := &idx.patterns[i]
+		idx.all[i] = p
+
+		// Pre-lowercase action triggers for MatchContext
+		actions := make([]string, len(p.Triggers.Actions))
+		for j, action := range p.Triggers.Actions {
+			actions[j] = strings.ToLower(action)
+		}
+		idx.actionsLower[i] = actions
 
 		// By ID
 		idx.byID[p.ID] = p
@@ -63,10 +90,13 @@ func (idx *Index) Build(patterns []ThreatPattern) {
 		idx.byLanguage[lang] = append(idx.byLanguage[lang], p)
 
 		// By keywords (from triggers)
+		kwSet := make(map[string]bool, len(p.Triggers.Keywords))
 		for _, kw := range p.Triggers.Keywords {
 			kwLower := strings.ToLower(kw)
 			idx.byKeyword[kwLower] = append(idx.byKeyword[kwLower], p)
+			kwSet[kwLower] = true
 		}
+		idx.keywordSets[p.ID] = kwSet
 	}
 }
 
@@ -105,6 +135,14 @@ func (idx *Index) GetByLanguage(language string) []*ThreatPattern {
 	return idx.byLanguage[strings.ToLower(language)]
 }
 
+// KeywordSet returns the precomputed lowercase keyword set for a pattern ID,
+// or nil if the pattern is not indexed
+func (idx *Index) KeywordSet(id string) map[string]bool {
+	idx.mu.RLock()
+	defer idx.mu.RUnlock()
+	return idx.keywordSets[id]
+}
+
 // GetAll returns all indexed patterns
 func (idx *Index) GetAll() []ThreatPattern {
 	idx.mu.RLock()
@@ -112,6 +150,15 @@ func (idx *Index) GetAll() []ThreatPattern {
 	return idx.patterns
 }
 
+// GetAllRefs returns pointers to all indexed patterns in index order.
+// The slice is maintained at build time; callers that reorder results
+// must copy it first.
+func (idx *Index) GetAllRefs() []*ThreatPattern {
+	idx.mu.RLock()
+	defer idx.mu.RUnlock()
+	return idx.all
+}
+
 // Count returns the number of indexed patterns
 func (idx *Index) Count() int {
 	idx.mu.RLock()
@@ -147,8 +194,8 @@ func (idx *Index) MatchContext(context string) []*ThreatPattern {
 		if seen[p.ID] {
 			continue
 		}
-		for _, action := range p.Triggers.Actions {
-			if strings.Contains(contextLower, strings.ToLower(action)) {
+		for _, action := range idx.actionsLower[i] {
+			if strings.Contains(contextLower, action) {
 				seen[p.ID] = true
 				matches = append(matches, p)
 				break
@@ -0,0 +1,92 @@
+package knowledge
+
+import (
+	"testing"
+)
+
+// buildGuardIndex creates an index with a small pattern set for guard tests
+func buildGuardIndex() *Index {
+	patterns := []ThreatPattern{
+		{
+			ID:       "TMKB-GUARD-001",
+			Severity: "high",
+			Triggers: Triggers{
+				Keywords: []string{"Background", "JOB"},
+				Actions:  []string{"Creating Endpoint"},
+			},
+		},
+		{
+			ID:       "TMKB-GUARD-002",
+			Severity: "low",
+			Triggers: Triggers{
+				Keywords: []string{"token"},
+			},
+		},
+	}
+
+	idx := NewIndex()
+	idx.Build(patterns)
+	return idx
+}
+
+// TestBuild_PrecomputesKeywordSets guards against regressions where queries
+// would silently fall back to rebuilding per-pattern keyword maps
+func TestBuild_PrecomputesKeywordSets(t *testing.T) {
+	idx := buildGuardIndex()
+
+	set := idx.KeywordSet("TMKB-GUARD-001")
+	if set == nil {
+		t.Fatal("KeywordSet(TMKB-GUARD-001) = nil, want precomputed set")
+	}
+
+	// Keywords must be stored lowercased
+	if !set["background"] || !set["job"] {
+		t.Errorf("KeywordSet = %v, want lowercase entries for Background/JOB", set)
+	}
+	if set["Background"] {
+		t.Error("KeywordSet contains original-case entry, want lowercase only")
+	}
+}
+
+// TestKeywordSet_UnknownID tests that unindexed patterns return nil,
+// which callers use to select the slice-based scoring fallback
+func TestKeywordSet_UnknownID(t *testing.T) {
+	idx := buildGuardIndex()
+
+	if set := idx.KeywordSet("TMKB-MISSING-999"); set != nil {
+		t.Errorf("KeywordSet(unknown) = %v, want nil", set)
+	}
+}
+
+// TestBuild_PrecomputesPatternRefs guards the prebuilt pointer view used by
+// unfiltered queries
+func TestBuild_PrecomputesPatternRefs(t *testing.T) {
+	idx := buildGuardIndex()
+
+	refs := idx.GetAllRefs()
+	if len(refs) != 2 {
+		t.Fatalf("GetAllRefs() returned %d patterns, want 2", len(refs))
+	}
+
+	// Refs must point into the index's pattern storage, in index order
+	all := idx.GetAll()
+	for i := range all {
+		if refs[i] != &all[i] {
+			t.Errorf("GetAllRefs()[%d] does not point at patterns[%d]", i, i)
+		}
+	}
+}
+
+// TestMatchContext_LowercasedActions verifies action triggers match
+// case-insensitively via the precomputed lowercase forms
+func TestMatchContext_LowercasedActions(t *testing.T) {
+	idx := buildGuardIndex()
+
+	matches := idx.MatchContext("I am creating endpoint handlers")
+	if len(matches) != 1 {
+		t.Fatalf("MatchContext returned %d patterns, want 1", len(matches))
+	}
+	if matches[0].ID != "TMKB-GUARD-001" {
+		t.Errorf("MatchContext matched %s, want TMKB-GUARD-001", matches[0].ID)
+	}
+}
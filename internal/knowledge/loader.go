@@ -4,7 +4,9 @@ import (
 	"fmt"
 	"os"
 	"path/filepath"
+	"runtime"
 	"strings"
+	"sync"
 
 	"gopkg.in/yaml.v3"
 )
@@ -17,6 +19,18 @@ type PatternWrapper struct {
 // Loader handles loading patterns from the filesystem
 type Loader struct {
 	basePath string
+
+	// resolvedBase caches the absolute, symlink-resolved form of basePath
+	// so validatePath does not repeat the resolution for every file loaded
+	resolveBaseOnce sync.Once
+	resolvedBase    string
+	resolveBaseErr  error
+
+	// loaded caches the result of a successful LoadAll so that LoadByID and
+	// LoadByCategory do not re-walk and re-parse the whole knowledge base
+	mu       sync.Mutex
+	loaded   bool
+	patterns []ThreatPattern
 }
 
 // NewLoader creates a new pattern loader with the given base path
@@ -24,31 +38,39 @@ func NewLoader(basePath string) *Loader {
 	return &Loader{basePath: basePath}
 }
 
-// LoadAll loads all patterns from the patterns directory
+// LoadAll loads all patterns from the patterns directory.
+// The result of the first successful load is cached for the lifetime of the
+// Loader; repeated calls return the cached patterns without touching disk.
 func (l *Loader) LoadAll() ([]ThreatPattern, error) {
-	var patterns []ThreatPattern
+	l.mu.Lock()
+	defer l.mu.Unlock()
+
+	if l.loaded {
+		return l.patterns, nil
+	}
 
-	err := filepath.Walk(l.basePath, func(path string, info os.FileInfo, err error) error {
+	// Collect pattern file paths first, then parse them concurrently below.
+	// WalkDir reuses the directory entry information from ReadDir instead of
+	// issuing a separate stat syscall for every file in the tree
+	var paths []string
+	err := filepath.WalkDir(l.basePath, func(path string, entry os.DirEntry, err error) error {
 		if err != nil {
 			return err
 		}
 
 		// Skip directories and non-YAML files
-		if info.IsDir() {
+		if entry.IsDir() {
 			return nil
 		}
 
-		ext := strings.ToLower(filepath.Ext(path))
-		if ext != ".yaml" && ext != ".yml" {
+		// EqualFold compares in place, where ToLower would allocate a
+		// lowered copy of the extension for every file walked
+		ext := filepath.Ext(path)
+		if !strings.EqualFold(ext, ".yaml") && !strings.EqualFold(ext, ".yml") {
 			return nil
 		}
 
-		pattern, err := l.LoadFile(path)
-		if err != nil {
-			return fmt.Errorf("failed to load %s: %w", path, err)
-		}
-
-		patterns = append(patterns, pattern)
+		paths = append(paths, path)
 		return nil
 	})
 
@@ -56,6 +78,39 @@ func (l *Loader) LoadAll() ([]ThreatPattern, error) {
 		return nil, fmt.Errorf("failed to walk patterns directory: %w", err)
 	}
 
+	// Parse files on all available cores; results are written by index so
+	// the returned order still matches the (deterministic) walk order
+	patterns := make([]ThreatPattern, len(paths))
+	loadErrs := make([]error, len(paths))
+
+	var wg sync.WaitGroup
+	sem := make(chan struct{}, runtime.GOMAXPROCS(0))
+	for i, path := range paths {
+		wg.Add(1)
+		sem <- struct{}{}
+		go func(i int, path string) {
+			defer wg.Done()
+			defer func() { <-sem }()
+
+			pattern, loadErr := l.LoadFile(path)
+			if loadErr != nil {
+				loadErrs[i] = fmt.Errorf("failed to load %s: %w", path, loadErr)
+				return
+			}
+			patterns[i] = pattern
+		}(i, path)
+	}
+	wg.Wait()
+
+	// Report the first failure in walk order, matching the sequential behavior
+	for _, loadErr := range loadErrs {
+		if loadErr != nil {
+			return nil, loadErr
+		}
+	}
+
+	l.loaded = true
+	l.patterns = patterns
 	return patterns, nil
 }
 
@@ -126,13 +181,9 @@ func (l *Loader) validatePath(path string) error {
 		cleanPath = resolved
 	}
 
-	cleanBase, err := filepath.Abs(filepath.Clean(l.basePath))
+	cleanBase, err := l.resolveBase()
 	if err != nil {
-		return fmt.Errorf("failed to resolve base path: %w", err)
-	}
-	// Resolve symlinks for base path (should always exist at runtime)
-	if resolved, resolveErr := filepath.EvalSymlinks(cleanBase); resolveErr == nil {
-		cleanBase = resolved
+		return err
 	}
 
 	// Check if the clean path is within the base path
@@ -148,3 +199,21 @@ func (l *Loader) validatePath(path string) error {
 
 	return nil
 }
+
+// resolveBase resolves basePath to absolute, symlink-free form once and
+// caches the result; every file in a LoadAll pass shares the same base
+func (l *Loader) resolveBase() (string, error) {
+	l.resolveBaseOnce.Do(func() {
+		cleanBase, err := filepath.Abs(filepath.Clean(l.basePath))
+		if err != nil {
+			l.resolveBaseErr = fmt.Errorf("failed to resolve base path: %w", err)
+			return
+		}
+		// Resolve symlinks for base path (should always exist at runtime)
+		if resolved, resolveErr := filepath.EvalSymlinks(cleanBase); resolveErr == nil {
+			cleanBase = resolved
+		}
+		l.resolvedBase = cleanBase
+	})
+	return l.resolvedBase, l.resolveBaseErr
+}
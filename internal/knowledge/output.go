@@ -3,9 +3,18 @@ package knowledge
 import (
 	"encoding/json"
 	"fmt"
+	"strconv"
 	"strings"
 )
 
+// Section separators used by the text formatters, built once at package
+// init instead of per formatted result
+var (
+	sepHeavy50 = strings.Repeat("=", 50)
+	sepHeavy60 = strings.Repeat("=", 60)
+	sepLight40 = strings.Repeat("-", 40)
+)
+
 // OutputFormat specifies the output format
 type OutputFormat string
 
@@ -38,28 +47,50 @@ func formatJSON(result QueryResult) (string, error) {
 func formatText(result QueryResult, _ bool) (string, error) {
 	var sb strings.Builder
 
-	sb.WriteString(fmt.Sprintf("Found %d relevant threat pattern(s)\n", result.PatternCount))
-	sb.WriteString(strings.Repeat("=", 50) + "\n\n")
+	// Fields are written directly rather than through fmt.Sprintf; each
+	// Sprintf re-parses its format string and boxes arguments, and this
+	// formatter runs once per query on the CLI path
+	sb.WriteString("Found ")
+	sb.WriteString(strconv.Itoa(result.PatternCount))
+	sb.WriteString(" relevant threat pattern(s)\n")
+	sb.WriteString(sepHeavy50)
+	sb.WriteString("\n\n")
 
 	for i, p := range result.Patterns {
-		sb.WriteString(fmt.Sprintf("[%d] %s", i+1, p.ID))
+		sb.WriteString("[")
+		sb.WriteString(strconv.Itoa(i + 1))
+		sb.WriteString("] ")
+		sb.WriteString(p.ID)
 		if p.Name != "" {
-			sb.WriteString(fmt.Sprintf(": %s", p.Name))
+			sb.WriteString(": ")
+			sb.WriteString(p.Name)
 		}
-		sb.WriteString(fmt.Sprintf(" (Severity: %s)\n", p.Severity))
-		sb.WriteString(strings.Repeat("-", 40) + "\n")
+		sb.WriteString(" (Severity: ")
+		sb.WriteString(p.Severity)
+		sb.WriteString(")\n")
+		sb.WriteString(sepLight40)
+		sb.WriteString("\n")
 
-		sb.WriteString(fmt.Sprintf("THREAT: %s\n\n", p.Threat))
-		sb.WriteString(fmt.Sprintf("CHECK:  %s\n\n", p.Check))
-		sb.WriteString(fmt.Sprintf("FIX:    %s\n\n", p.Fix))
+		sb.WriteString("THREAT: ")
+		sb.WriteString(p.Threat)
+		sb.WriteString("\n\nCHECK:  ")
+		sb.WriteString(p.Check)
+		sb.WriteString("\n\nFIX:    ")
+		sb.WriteString(p.Fix)
+		sb.WriteString("\n\n")
 	}
 
 	if result.CodePattern != nil {
-		sb.WriteString(strings.Repeat("=", 50) + "\n")
+		sb.WriteString(sepHeavy50)
+		sb.WriteString("\n")
 		sb.WriteString("SECURE CODE TEMPLATE\n")
-		sb.WriteString(fmt.Sprintf("Language: %s | Framework: %s\n",
-			result.CodePattern.Language, result.CodePattern.Framework))
-		sb.WriteString(strings.Repeat("-", 40) + "\n")
+		sb.WriteString("Language: ")
+		sb.WriteString(result.CodePattern.Language)
+		sb.WriteString(" | Framework: ")
+		sb.WriteString(result.CodePattern.Framework)
+		sb.WriteString("\n")
+		sb.WriteString(sepLight40)
+		sb.WriteString("\n")
 		sb.WriteString(result.CodePattern.SecureTemplate)
 		sb.WriteString("\n")
 	}
@@ -96,16 +127,16 @@ func formatPatternText(p *ThreatPattern) string {
 		p.Tier, p.Severity, p.Likelihood))
 	sb.WriteString(fmt.Sprintf("Category: %s > %s\n", p.Category, p.Subcategory))
 	sb.WriteString(fmt.Sprintf("Language: %s | Framework: %s\n", p.Language, p.Framework))
-	sb.WriteString(strings.Repeat("=", 60) + "\n\n")
+	sb.WriteString(sepHeavy60 + "\n\n")
 
 	// Description
 	sb.WriteString("DESCRIPTION\n")
-	sb.WriteString(strings.Repeat("-", 40) + "\n")
+	sb.WriteString(sepLight40 + "\n")
 	sb.WriteString(strings.TrimSpace(p.Description) + "\n\n")
 
 	// Agent Summary
 	sb.WriteString("AGENT SUMMARY\n")
-	sb.WriteString(strings.Repeat("-", 40) + "\n")
+	sb.WriteString(sepLight40 + "\n")
 	sb.WriteString(fmt.Sprintf("Threat: %s\n", p.AgentSummary.Threat))
 	sb.WriteString(fmt.Sprintf("Check:  %s\n", p.AgentSummary.Check))
 	sb.WriteString(fmt.Sprintf("Fix:    %s\n\n", p.AgentSummary.Fix))
@@ -113,7 +144,7 @@ func formatPatternText(p *ThreatPattern) string {
 	// LLM Blindspots
 	if len(p.Differentiation.LLMBlindspots) > 0 {
 		sb.WriteString("LLM BLINDSPOTS\n")
-		sb.WriteString(strings.Repeat("-", 40) + "\n")
+		sb.WriteString(sepLight40 + "\n")
 		for _, bs := range p.Differentiation.LLMBlindspots {
 			sb.WriteString(fmt.Sprintf("• %s\n", bs))
 		}
@@ -123,7 +154,7 @@ func formatPatternText(p *ThreatPattern) string {
 	// Mitigations
 	if len(p.Mitigations) > 0 {
 		sb.WriteString("MITIGATIONS\n")
-		sb.WriteString(strings.Repeat("-", 40) + "\n")
+		sb.WriteString(sepLight40 + "\n")
 		for _, m := range p.Mitigations {
 			name := m.Name
 			if name == "" {
@@ -139,7 +170,7 @@ func formatPatternText(p *ThreatPattern) string {
 	// Generalizes To
 	if len(p.GeneralizesTo) > 0 {
 		sb.WriteString("GENERALIZES TO\n")
-		sb.WriteString(strings.Repeat("-", 40) + "\n")
+		sb.WriteString(sepLight40 + "\n")
 		for _, g := range p.GeneralizesTo {
 			sb.WriteString(fmt.Sprintf("• %s\n", g))
 		}
@@ -149,7 +180,7 @@ func formatPatternText(p *ThreatPattern) string {
 	// References
 	if len(p.Provenance.PublicReferences) > 0 {
 		sb.WriteString("REFERENCES\n")
-		sb.WriteString(strings.Repeat("-", 40) + "\n")
+		sb.WriteString(sepLight40 + "\n")
 		for _, ref := range p.Provenance.PublicReferences {
 			if ref.CWE != "" {
 				sb.WriteString(fmt.Sprintf("• %s: %s\n", ref.CWE, ref.Name))
@@ -102,11 +102,22 @@ func Query(idx *Index, opts QueryOptions) QueryResult {
 	if opts.Context != "" {
 		candidates = idx.MatchContext(opts.Context)
 	} else {
-		// Otherwise get all patterns
-		all := idx.GetAll()
-		for i := range all {
-			candidates = append(candidates, &all[i])
+		// Otherwise start from the narrowest prebuilt index for the given
+		// filters rather than scanning every pattern; the filter chain below
+		// still applies, so overlapping filters stay correct. Copied because
+		// the slice is reordered in place.
+		var base []*ThreatPattern
+		switch {
+		case opts.Category != "":
+			base = idx.GetByCategory(opts.Category)
+		case opts.Language != "":
+			base = idx.GetByLanguage(opts.Language)
+		case opts.Framework != "" && opts.Framework != "any":
+			base = idx.GetByFramework(opts.Framework)
+		default:
+			base = idx.GetAllRefs()
 		}
+		candidates = append([]*ThreatPattern(nil), base...)
 	}
 
 	// Filter by language if specified
@@ -124,47 +135,59 @@ func Query(idx *Index, opts QueryOptions) QueryResult {
 		candidates = filterByCategory(candidates, opts.Category)
 	}
 
-	// Sort by relevance if context provided, otherwise by severity
+	// Resolve the result limit up front so ordering work can stop at the
+	// patterns that will actually be returned
+	limit := opts.Limit
+	if limit <= 0 {
+		if opts.Verbosity == "human" {
+			limit = 10
+		} else {
+			limit = 3
+		}
+	}
+
+	// Sort by relevance if context provided, otherwise by severity.
+	// Only the top `limit` patterns need to be in final order; the
+	// remaining candidates are counted but never serialized.
 	if opts.Context != "" && strings.TrimSpace(opts.Context) != "" {
 		// Extract keywords from context
 		queryKeywords := ExtractKeywords(opts.Context)
 
-		// Calculate relevance scores
+		// Calculate relevance scores using the index's precomputed keyword
+		// sets; fall back to the slice-based path for unindexed patterns
 		scored := make([]patternWithScore, len(candidates))
 		for i, p := range candidates {
-			score := CalculateRelevance(queryKeywords, p.Triggers.Keywords)
+			var score float64
+			if set := idx.KeywordSet(p.ID); set != nil {
+				score = CalculateRelevanceFromSet(queryKeywords, set)
+			} else {
+				score = CalculateRelevance(queryKeywords, p.Triggers.Keywords)
+			}
 			scored[i] = patternWithScore{
 				pattern: p,
 				score:   score,
 			}
 		}
 
-		// Sort by relevance (highest first), then severity, then likelihood
-		sortByRelevance(scored)
+		// Order the top results by relevance (highest first), then
+		// severity, then likelihood
+		topByRelevance(scored, limit)
 
 		// Extract sorted patterns
 		for i, s := range scored {
 			candidates[i] = s.pattern
 		}
 	} else {
-		// Sort by severity (critical > high > medium > low) then by likelihood
-		sortBySeverity(candidates)
+		// Order the top results by severity (critical > high > medium > low)
+		// then by likelihood
+		topBySeverity(candidates, limit)
 	}
 
 	// Build response based on verbosity
 	if opts.Verbosity == "human" {
-		limit := opts.Limit
-		if limit <= 0 {
-			limit = 10
-		}
 		return buildVerboseResponse(candidates, limit)
-	} else {
-		limit := opts.Limit
-		if limit <= 0 {
-			limit = 3
-		}
-		return buildAgentResponse(candidates, limit)
 	}
+	return buildAgentResponse(candidates, limit)
 }
 
 // filterByLanguage filters patterns by programming language
@@ -203,78 +226,100 @@ func filterByCategory(patterns []*ThreatPattern, category string) []*ThreatPatte
 	return filtered
 }
 
-// sortByRelevance sorts patterns by relevance score (highest first),
-// with severity and likelihood as tiebreakers
-func sortByRelevance(scored []patternWithScore) {
-	severityOrder := map[string]int{
-		"critical": 0,
-		"high":     1,
-		"medium":   2,
-		"low":      3,
-	}
+// severityOrder and likelihoodOrder rank patterns for sorting.
+// Built once at package init rather than per sort call.
+var severityOrder = map[string]int{
+	"critical": 0,
+	"high":     1,
+	"medium":   2,
+	"low":      3,
+}
+
+var likelihoodOrder = map[string]int{
+	"high":   0,
+	"medium": 1,
+	"low":    2,
+}
 
-	likelihoodOrder := map[string]int{
-		"high":   0,
-		"medium": 1,
-		"low":    2,
+// lessScored reports whether a ranks before b: relevance score (higher is
+// better), then severity, then likelihood, then alphabetical by ID
+func lessScored(a, b patternWithScore) bool {
+	// Primary: relevance score (higher is better)
+	if a.score != b.score {
+		return a.score > b.score
 	}
+	return lessSevere(a.pattern, b.pattern)
+}
 
-	sort.Slice(scored, func(i, j int) bool {
-		// Primary: relevance score (higher is better)
-		if scored[i].score != scored[j].score {
-			return scored[i].score > scored[j].score
-		}
+// lessSevere reports whether a ranks before b by severity
+// (critical > high > medium > low), then likelihood, then ID
+func lessSevere(a, b *ThreatPattern) bool {
+	sa := severityOrder[strings.ToLower(a.Severity)]
+	sb := severityOrder[strings.ToLower(b.Severity)]
+	if sa != sb {
+		return sa < sb
+	}
 
-		// Secondary: severity (critical > high > medium > low)
-		si := severityOrder[strings.ToLower(scored[i].pattern.Severity)]
-		sj := severityOrder[strings.ToLower(scored[j].pattern.Severity)]
-		if si != sj {
-			return si < sj
-		}
+	la := likelihoodOrder[strings.ToLower(a.Likelihood)]
+	lb := likelihoodOrder[strings.ToLower(b.Likelihood)]
+	if la != lb {
+		return la < lb
+	}
 
-		// Tertiary: likelihood (high > medium > low)
-		li := likelihoodOrder[strings.ToLower(scored[i].pattern.Likelihood)]
-		lj := likelihoodOrder[strings.ToLower(scored[j].pattern.Likelihood)]
-		if li != lj {
-			return li < lj
-		}
+	// Alphabetical by ID as tiebreaker
+	return a.ID < b.ID
+}
 
-		// Quaternary: alphabetical by ID
-		return scored[i].pattern.ID < scored[j].pattern.ID
+// sortByRelevance sorts patterns by relevance score (highest first),
+// with severity and likelihood as tiebreakers
+func sortByRelevance(scored []patternWithScore) {
+	sort.Slice(scored, func(i, j int) bool {
+		return lessScored(scored[i], scored[j])
 	})
 }
 
-// sortBySeverity sorts patterns by severity (critical > high > medium > low)
-func sortBySeverity(patterns []*ThreatPattern) {
-	severityOrder := map[string]int{
-		"critical": 0,
-		"high":     1,
-		"medium":   2,
-		"low":      3,
+// topByRelevance places the k best-ranked entries, in order, at the front
+// of scored. For small k this is a partial selection (O(n·k)) instead of a
+// full O(n log n) sort of candidates that would never be returned.
+func topByRelevance(scored []patternWithScore, k int) {
+	if k >= len(scored) {
+		sortByRelevance(scored)
+		return
 	}
-
-	likelihoodOrder := map[string]int{
-		"high":   0,
-		"medium": 1,
-		"low":    2,
+	for i := 0; i < k; i++ {
+		best := i
+		for j := i + 1; j < len(scored); j++ {
+			if lessScored(scored[j], scored[best]) {
+				best = j
+			}
+		}
+		scored[i], scored[best] = scored[best], scored[i]
 	}
+}
 
+// sortBySeverity sorts patterns by severity (critical > high > medium > low)
+func sortBySeverity(patterns []*ThreatPattern) {
 	sort.Slice(patterns, func(i, j int) bool {
-		si := severityOrder[strings.ToLower(patterns[i].Severity)]
-		sj := severityOrder[strings.ToLower(patterns[j].Severity)]
-		if si != sj {
-			return si < sj
-		}
+		return lessSevere(patterns[i], patterns[j])
+	})
+}
 
-		li := likelihoodOrder[strings.ToLower(patterns[i].Likelihood)]
-		lj := likelihoodOrder[strings.ToLower(patterns[j].Likelihood)]
-		if li != lj {
-			return li < lj
+// topBySeverity places the k most severe patterns, in order, at the front
+// of the slice; see topByRelevance for the selection strategy
+func topBySeverity(patterns []*ThreatPattern, k int) {
+	if k >= len(patterns) {
+		sortBySeverity(patterns)
+		return
+	}
+	for i := 0; i < k; i++ {
+		best := i
+		for j := i + 1; j < len(patterns); j++ {
+			if lessSevere(patterns[j], patterns[best]) {
+				best = j
+			}
 		}
-
-		// Alphabetical by ID as tiebreaker
-		return patterns[i].ID < patterns[j].ID
-	})
+		patterns[i], patterns[best] = patterns[best], patterns[i]
+	}
 }
 
 // extractCodePattern finds the best code example for the query
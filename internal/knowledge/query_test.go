@@ -1,11 +1,27 @@
 package knowledge
 
 import (
+	"sync"
 	"testing"
 )
 
-// createTestIndex creates an index with test patterns for query testing
+// testIndexOnce guards the shared query-test index; Query never mutates the
+// index, so the tests below can reuse one build instead of re-indexing the
+// same four patterns per test
+var (
+	testIndexOnce sync.Once
+	testIndex     *Index
+)
+
+// createTestIndex returns an index with test patterns for query testing
 func createTestIndex() *Index {
+	testIndexOnce.Do(func() {
+		testIndex = buildTestIndex()
+	})
+	return testIndex
+}
+
+func buildTestIndex() *Index {
 	patterns := []ThreatPattern{
 		{
 			ID:         "TMKB-AUTHZ-001",
@@ -82,68 +98,41 @@ func createTestIndex() *Index {
 	return idx
 }
 
-// TestQuery_RelevanceSorting_BackgroundJob tests that background job query
-// returns AUTHZ-001 first due to relevance, even though AUTHZ-002 has higher severity
-func TestQuery_RelevanceSorting_BackgroundJob(t *testing.T) {
-	idx := createTestIndex()
-
-	opts := QueryOptions{
-		Context: "background job authorization",
-		Limit:   3,
-	}
-
-	result := Query(idx, opts)
-
-	// Should return patterns, with AUTHZ-001 ranked highest due to keyword matches
-	if len(result.Patterns) == 0 {
-		t.Fatal("Expected patterns in result, got none")
-	}
-
-	// AUTHZ-001 should be first (highest relevance: matches "background", "job", "authorization")
-	if result.Patterns[0].ID != "TMKB-AUTHZ-001" {
-		t.Errorf("Expected TMKB-AUTHZ-001 first (highest relevance), got %s", result.Patterns[0].ID)
+// TestQuery_RelevanceSorting tests that queries rank the pattern with the
+// best keyword match first, even when another pattern has higher severity
+func TestQuery_RelevanceSorting(t *testing.T) {
+	tests := []struct {
+		name      string
+		context   string
+		wantFirst string
+	}{
+		// AUTHZ-001 matches "background", "job", "authorization"
+		{"background job", "background job authorization", "TMKB-AUTHZ-001"},
+		// AUTHZ-002 matches "multi-tenant", "organization", "isolation"
+		{"multi-tenant", "multi-tenant organization data isolation", "TMKB-AUTHZ-002"},
+		// AUTHZ-003 matches "jwt", "token", "validation"
+		{"jwt", "JWT token validation", "TMKB-AUTHZ-003"},
 	}
-}
 
-// TestQuery_RelevanceSorting_MultiTenant tests multi-tenant query
-func TestQuery_RelevanceSorting_MultiTenant(t *testing.T) {
 	idx := createTestIndex()
 
-	opts := QueryOptions{
-		Context: "multi-tenant organization data isolation",
-		Limit:   3,
-	}
+	for _, tt := range tests {
+		t.Run(tt.name, func(t *testing.T) {
+			opts := QueryOptions{
+				Context: tt.context,
+				Limit:   3,
+			}
 
-	result := Query(idx, opts)
-
-	if len(result.Patterns) == 0 {
-		t.Fatal("Expected patterns in result, got none")
-	}
-
-	// AUTHZ-002 should be first (matches "multi-tenant", "organization", "isolation")
-	if result.Patterns[0].ID != "TMKB-AUTHZ-002" {
-		t.Errorf("Expected TMKB-AUTHZ-002 first (multi-tenant match), got %s", result.Patterns[0].ID)
-	}
-}
-
-// TestQuery_RelevanceSorting_JWT tests JWT validation query
-func TestQuery_RelevanceSorting_JWT(t *testing.T) {
-	idx := createTestIndex()
+			result := Query(idx, opts)
 
-	opts := QueryOptions{
-		Context: "JWT token validation",
-		Limit:   3,
-	}
-
-	result := Query(idx, opts)
-
-	if len(result.Patterns) == 0 {
-		t.Fatal("Expected patterns in result, got none")
-	}
+			if len(result.Patterns) == 0 {
+				t.Fatal("Expected patterns in result, got none")
+			}
 
-	// AUTHZ-003 should be first (matches "jwt", "token", "validation")
-	if result.Patterns[0].ID != "TMKB-AUTHZ-003" {
-		t.Errorf("Expected TMKB-AUTHZ-003 first (JWT match), got %s", result.Patterns[0].ID)
+			if result.Patterns[0].ID != tt.wantFirst {
+				t.Errorf("Expected %s first (highest relevance), got %s", tt.wantFirst, result.Patterns[0].ID)
+			}
+		})
 	}
 }
 
@@ -10,16 +10,22 @@ const tokenLimit = 500
 
 // buildAgentResponse builds a token-limited response for agent consumption
 func buildAgentResponse(candidates []*ThreatPattern, limit int) QueryResult {
-	counter, err := NewTokenCounter()
-	if err != nil {
-		log.Printf("Warning: Token counter initialization failed: %v, using approximation", err)
-	}
-
 	result := QueryResult{
 		PatternCount: len(candidates),
 		Patterns:     make([]PatternOutput, 0, limit),
 	}
 
+	// Fast path: nothing matched, so skip token counting entirely (and,
+	// on a cold process, the encoder initialization behind it)
+	if len(candidates) == 0 {
+		return result
+	}
+
+	counter, err := sharedTokenCounter()
+	if err != nil {
+		log.Printf("Warning: Token counter initialization failed: %v, using approximation", err)
+	}
+
 	totalTokens := 0
 	patternsAdded := 0
 
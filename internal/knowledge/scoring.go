@@ -13,22 +13,25 @@ func ExtractKeywords(input string) []string {
 		return []string{}
 	}
 
-	// Split into words
-	words := strings.Fields(input)
+	// Lowercase the whole input in one pass, then split into words;
+	// n-grams built from these words need no further case conversion
+	words := strings.Fields(strings.ToLower(input))
 	if len(words) == 0 {
 		return []string{}
 	}
 
-	// Use map for deduplication
-	keywordMap := make(map[string]bool)
+	// Use map for deduplication, sized for the n-gram count upper bound
+	maxNgrams := 3*len(words) - 3
+	if maxNgrams < 1 {
+		maxNgrams = 1
+	}
+	keywordMap := make(map[string]bool, maxNgrams)
 
 	// Extract N-grams (1, 2, and 3)
 	for n := 1; n <= 3 && n <= len(words); n++ {
 		for i := 0; i <= len(words)-n; i++ {
 			// Take n words starting at position i
-			ngram := strings.Join(words[i:i+n], " ")
-			// Store lowercase version
-			keywordMap[strings.ToLower(ngram)] = true
+			keywordMap[strings.Join(words[i:i+n], " ")] = true
 		}
 	}
 
@@ -75,3 +78,28 @@ func CalculateRelevance(queryKeywords, patternKeywords []string) float64 {
 
 	return matchWeight + coverageRatio
 }
+
+// CalculateRelevanceFromSet is CalculateRelevance for callers that already
+// hold the pattern's keywords as a lowercase set (see Index.KeywordSet),
+// avoiding the per-call map rebuild.
+func CalculateRelevanceFromSet(queryKeywords []string, patternSet map[string]bool) float64 {
+	if len(queryKeywords) == 0 || len(patternSet) == 0 {
+		return 0.0
+	}
+
+	matchCount := 0
+	for _, queryKeyword := range queryKeywords {
+		if patternSet[strings.ToLower(queryKeyword)] {
+			matchCount++
+		}
+	}
+
+	if matchCount == 0 {
+		return 0.0
+	}
+
+	matchWeight := float64(matchCount) * 2.0
+	coverageRatio := float64(matchCount) / float64(len(patternSet))
+
+	return matchWeight + coverageRatio
+}
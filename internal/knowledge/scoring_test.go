@@ -7,6 +7,8 @@ import (
 
 // TestExtractKeywords_SingleWord tests extraction of 1-grams from a single word
 func TestExtractKeywords_SingleWord(t *testing.T) {
+	t.Parallel()
+
 	input := "background"
 	expected := []string{"background"}
 
@@ -19,6 +21,8 @@ func TestExtractKeywords_SingleWord(t *testing.T) {
 
 // TestExtractKeywords_TwoWords tests extraction of 1-grams and 2-grams
 func TestExtractKeywords_TwoWords(t *testing.T) {
+	t.Parallel()
+
 	input := "background job"
 	expected := []string{"background", "job", "background job"}
 
@@ -31,6 +35,8 @@ func TestExtractKeywords_TwoWords(t *testing.T) {
 
 // TestExtractKeywords_ThreeWords tests extraction of 1-grams, 2-grams, and 3-grams
 func TestExtractKeywords_ThreeWords(t *testing.T) {
+	t.Parallel()
+
 	input := "multi tenant API"
 	expected := []string{
 		"multi", "tenant", "api",
@@ -47,6 +53,8 @@ func TestExtractKeywords_ThreeWords(t *testing.T) {
 
 // TestExtractKeywords_CaseInsensitive tests that keywords are lowercased
 func TestExtractKeywords_CaseInsensitive(t *testing.T) {
+	t.Parallel()
+
 	input := "JWT Validation"
 	expected := []string{"jwt", "validation", "jwt validation"}
 
@@ -59,6 +67,8 @@ func TestExtractKeywords_CaseInsensitive(t *testing.T) {
 
 // TestExtractKeywords_Deduplication tests that duplicate keywords are removed
 func TestExtractKeywords_Deduplication(t *testing.T) {
+	t.Parallel()
+
 	input := "API API endpoint"
 	expected := []string{
 		"api", "endpoint",
@@ -75,6 +85,8 @@ func TestExtractKeywords_Deduplication(t *testing.T) {
 
 // TestExtractKeywords_EmptyString tests handling of empty input
 func TestExtractKeywords_EmptyString(t *testing.T) {
+	t.Parallel()
+
 	input := ""
 	expected := []string{}
 
@@ -87,6 +99,8 @@ func TestExtractKeywords_EmptyString(t *testing.T) {
 
 // TestExtractKeywords_Whitespace tests handling of whitespace-only input
 func TestExtractKeywords_Whitespace(t *testing.T) {
+	t.Parallel()
+
 	input := "   \t\n  "
 	expected := []string{}
 
@@ -99,6 +113,8 @@ func TestExtractKeywords_Whitespace(t *testing.T) {
 
 // TestExtractKeywords_LongPhrase tests N-gram limits with longer phrases
 func TestExtractKeywords_LongPhrase(t *testing.T) {
+	t.Parallel()
+
 	input := "multi tenant API background job authorization"
 
 	// Should extract 1-grams, 2-grams, and 3-grams only
@@ -163,6 +179,8 @@ func contains(slice []string, item string) bool {
 
 // TestCalculateRelevance_NoMatches tests scoring when no keywords match
 func TestCalculateRelevance_NoMatches(t *testing.T) {
+	t.Parallel()
+
 	queryKeywords := []string{"jwt", "validation"}
 	patternKeywords := []string{"background", "job", "authorization"}
 
@@ -175,6 +193,8 @@ func TestCalculateRelevance_NoMatches(t *testing.T) {
 
 // TestCalculateRelevance_SingleMatch tests scoring with one matching keyword
 func TestCalculateRelevance_SingleMatch(t *testing.T) {
+	t.Parallel()
+
 	queryKeywords := []string{"background", "job"}
 	patternKeywords := []string{"authorization", "background", "tenant"}
 
@@ -190,6 +210,8 @@ func TestCalculateRelevance_SingleMatch(t *testing.T) {
 
 // TestCalculateRelevance_MultipleMatches tests scoring with multiple matching keywords
 func TestCalculateRelevance_MultipleMatches(t *testing.T) {
+	t.Parallel()
+
 	queryKeywords := []string{"background", "job", "authorization"}
 	patternKeywords := []string{"background", "job", "tenant", "api"}
 
@@ -205,6 +227,8 @@ func TestCalculateRelevance_MultipleMatches(t *testing.T) {
 
 // TestCalculateRelevance_AllMatch tests scoring when all pattern keywords match
 func TestCalculateRelevance_AllMatch(t *testing.T) {
+	t.Parallel()
+
 	queryKeywords := []string{"background", "job", "api", "tenant", "authorization"}
 	patternKeywords := []string{"background", "job", "api"}
 
@@ -220,6 +244,8 @@ func TestCalculateRelevance_AllMatch(t *testing.T) {
 
 // TestCalculateRelevance_CaseInsensitiveMatching tests that matching is case-insensitive
 func TestCalculateRelevance_CaseInsensitiveMatching(t *testing.T) {
+	t.Parallel()
+
 	queryKeywords := []string{"jwt", "validation"}
 	patternKeywords := []string{"JWT", "Authorization"}
 
@@ -235,6 +261,8 @@ func TestCalculateRelevance_CaseInsensitiveMatching(t *testing.T) {
 
 // TestCalculateRelevance_EmptyQuery tests handling of empty query keywords
 func TestCalculateRelevance_EmptyQuery(t *testing.T) {
+	t.Parallel()
+
 	queryKeywords := []string{}
 	patternKeywords := []string{"background", "job"}
 
@@ -247,6 +275,8 @@ func TestCalculateRelevance_EmptyQuery(t *testing.T) {
 
 // TestCalculateRelevance_EmptyPattern tests handling of empty pattern keywords
 func TestCalculateRelevance_EmptyPattern(t *testing.T) {
+	t.Parallel()
+
 	queryKeywords := []string{"background", "job"}
 	patternKeywords := []string{}
 
@@ -261,6 +291,8 @@ func TestCalculateRelevance_EmptyPattern(t *testing.T) {
 // Pattern C: 4 matches out of 20 keywords should score higher than
 // Pattern A: 3 matches out of 10 keywords
 func TestCalculateRelevance_HybridFormulaExample(t *testing.T) {
+	t.Parallel()
+
 	queryKeywords := []string{"multi", "tenant", "api", "background", "job"}
 
 	// Pattern A: 3 matches out of 10 keywords
@@ -1,6 +1,8 @@
 package knowledge
 
 import (
+	"sync"
+
 	tiktoken "github.com/pkoukk/tiktoken-go"
 )
 
@@ -18,6 +20,30 @@ func NewTokenCounter() (*TokenCounter, error) {
 	return &TokenCounter{encoder: enc}, nil
 }
 
+var (
+	sharedCounterOnce sync.Once
+	sharedCounter     *TokenCounter
+	sharedCounterErr  error
+)
+
+// sharedTokenCounter returns a process-wide token counter, initializing the
+// cl100k_base encoder once; building the encoder is far more expensive than
+// any single count, so hot paths should prefer this over NewTokenCounter
+func sharedTokenCounter() (*TokenCounter, error) {
+	sharedCounterOnce.Do(func() {
+		sharedCounter, sharedCounterErr = NewTokenCounter()
+	})
+	return sharedCounter, sharedCounterErr
+}
+
+// WarmTokenCounter eagerly initializes the shared token counter so the first
+// query served by a long-running process does not pay the one-time encoder
+// construction cost. Initialization errors are not reported here; callers of
+// the counter fall back to the character approximation as usual.
+func WarmTokenCounter() {
+	_, _ = sharedTokenCounter()
+}
+
 // CountTokens counts the number of tokens in the given text
 // Falls back to character/4 approximation if encoder is unavailable
 func (tc *TokenCounter) CountTokens(text string) int {
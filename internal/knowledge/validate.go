@@ -5,6 +5,10 @@ import (
 	"strings"
 )
 
+// validSeverities is the severity allowlist, built once at package init
+// rather than per Validate call
+var validSeverities = map[string]bool{"critical": true, "high": true, "medium": true, "low": true}
+
 // ValidationError represents a single validation error
 type ValidationError struct {
 	PatternID string
@@ -48,7 +52,6 @@ func Validate(p ThreatPattern) ValidationResult {
 	}
 
 	// Validate severity value
-	validSeverities := map[string]bool{"critical": true, "high": true, "medium": true, "low": true}
 	if p.Severity != "" && !validSeverities[strings.ToLower(p.Severity)] {
 		result.addError(p.ID, "severity", "must be critical, high, medium, or low")
 	}
@@ -178,8 +181,10 @@ func (r *ValidationResult) addWarning(patternID, field, message string) {
 // ValidateAll validates all patterns and returns results
 func ValidateAll(patterns []ThreatPattern) []ValidationResult {
 	results := make([]ValidationResult, 0, len(patterns))
-	for _, p := range patterns {
-		results = append(results, Validate(p))
+	// Index-based iteration avoids an extra copy of each (large) pattern
+	// on top of the one made for the Validate call
+	for i := range patterns {
+		results = append(results, Validate(patterns[i]))
 	}
 	return results
 }
@@ -17,16 +17,21 @@ var handlers = map[string]Handler{
 
 // handleMessage processes a single JSON-RPC message
 func (s *Server) handleMessage(msg []byte) ([]byte, error) {
-	// Try to parse as request first
+	// Parse once; a request and a notification differ only by the presence
+	// of an ID, so a single unmarshal covers both message kinds
 	var req JSONRPCRequest
-	if err := json.Unmarshal(msg, &req); err == nil && req.ID != nil {
-		return s.handleRequest(&req)
-	}
-
-	// Try to parse as notification
-	var notif JSONRPCNotification
-	if err := json.Unmarshal(msg, &notif); err == nil && notif.Method != "" {
-		return s.handleNotification(&notif)
+	if err := json.Unmarshal(msg, &req); err == nil {
+		if req.ID != nil {
+			return s.handleRequest(&req)
+		}
+		if req.Method != "" {
+			notif := JSONRPCNotification{
+				JSONRPC: req.JSONRPC,
+				Method:  req.Method,
+				Params:  req.Params,
+			}
+			return s.handleNotification(&notif)
+		}
 	}
 
 	// Invalid message
@@ -26,14 +26,32 @@ type Server struct {
 	state              serverState
 	protocolVersion    string
 	clientCapabilities map[string]interface{}
-	mu                 sync.RWMutex
+
+	// toolDef is the tmkb_query tool definition, built once at construction;
+	// the definition is static, so tools/list serves the same maps every call
+	toolDef map[string]interface{}
+
+	// queryCache memoizes query responses by parameter tuple. The index is
+	// immutable for the lifetime of the server, so entries never go stale;
+	// the cache is bounded so a client sending unique contexts cannot grow
+	// memory without limit.
+	queryCache   map[string]string
+	queryCacheMu sync.Mutex
+
+	mu sync.RWMutex
 }
 
+// maxQueryCacheEntries bounds the response cache; when full, the cache is
+// reset rather than tracking per-entry recency
+const maxQueryCacheEntries = 256
+
 // NewServer creates a new MCP server
 func NewServer(index *knowledge.Index) *Server {
 	return &Server{
-		index: index,
-		state: stateNotInitialized,
+		index:      index,
+		state:      stateNotInitialized,
+		toolDef:    buildToolDefinition(),
+		queryCache: make(map[string]string),
 	}
 }
 
@@ -53,14 +71,22 @@ func (s *Server) getState() serverState {
 
 // ToolDefinition returns the MCP tool definition for tmkb_query
 func (s *Server) ToolDefinition() map[string]interface{} {
+	return s.toolDef
+}
+
+// buildToolDefinition constructs the static tmkb_query tool definition,
+// including the strict schema constraints served by tools/list
+func buildToolDefinition() map[string]interface{} {
 	return map[string]interface{}{
 		"name":        "tmkb_query",
 		"description": "Query the Threat Model Knowledge Base for authorization security threats relevant to your implementation. Returns concise, actionable security context optimized for code generation.",
 		"inputSchema": map[string]interface{}{
-			"type": "object",
+			"type":                 "object",
+			"additionalProperties": false,
 			"properties": map[string]interface{}{
 				"context": map[string]interface{}{
 					"type":        "string",
+					"minLength":   1,
 					"description": "What you're implementing (e.g., 'multi-tenant API endpoint', 'background job processing', 'admin dashboard')",
 				},
 				"language": map[string]interface{}{
@@ -97,6 +123,17 @@ func (s *Server) HandleRequest(input map[string]interface{}) (string, error) {
 		verbosity = "agent"
 	}
 
+	// Serve repeated queries from the response cache; patterns are loaded
+	// once per process, so an identical parameter tuple yields an
+	// identical response
+	cacheKey := context + "\x00" + language + "\x00" + framework + "\x00" + verbosity
+	s.queryCacheMu.Lock()
+	if cached, ok := s.queryCache[cacheKey]; ok {
+		s.queryCacheMu.Unlock()
+		return cached, nil
+	}
+	s.queryCacheMu.Unlock()
+
 	// Build query options
 	opts := knowledge.QueryOptions{
 		Context:   context,
@@ -109,13 +146,23 @@ func (s *Server) HandleRequest(input map[string]interface{}) (string, error) {
 	// Execute query
 	result := knowledge.Query(s.index, opts)
 
-	// Return JSON
-	data, err := json.MarshalIndent(result, "", "  ")
+	// Return compact JSON; the payload is consumed by agents, so indentation
+	// only adds bytes (and tokens) to every response
+	data, err := json.Marshal(result)
 	if err != nil {
 		return "", fmt.Errorf("failed to marshal result: %w", err)
 	}
 
-	return string(data), nil
+	response := string(data)
+
+	s.queryCacheMu.Lock()
+	if len(s.queryCache) >= maxQueryCacheEntries {
+		s.queryCache = make(map[string]string)
+	}
+	s.queryCache[cacheKey] = response
+	s.queryCacheMu.Unlock()
+
+	return response, nil
 }
 
 // ServeStdio runs the MCP server over stdin/stdout
@@ -123,9 +170,11 @@ func (s *Server) ServeStdio(r io.Reader, w io.Writer) error {
 	scanner := bufio.NewScanner(r)
 	writer := bufio.NewWriter(w)
 
-	// Set max buffer size to 10MB
+	// Allow messages up to 10MB, but start with a small buffer; the scanner
+	// grows it on demand so typical requests never touch the 10MB ceiling
+	const initialBufferSize = 64 * 1024
 	const maxBufferSize = 10 * 1024 * 1024
-	buf := make([]byte, maxBufferSize)
+	buf := make([]byte, initialBufferSize)
 	scanner.Buffer(buf, maxBufferSize)
 
 	for scanner.Scan() {
@@ -138,16 +187,15 @@ func (s *Server) ServeStdio(r io.Reader, w io.Writer) error {
 			continue
 		}
 
-		// Write response if non-empty (notifications have no response)
+		// Write response if non-empty (notifications have no response).
+		// The trailing newline is appended to the marshaled response so the
+		// whole message goes out in a single write followed by one flush.
 		if len(resp) > 0 {
+			resp = append(resp, '\n')
 			if _, err := writer.Write(resp); err != nil {
 				log.Printf("[ERROR] Failed to write response: %v", err)
 				return fmt.Errorf("failed to write response: %w", err)
 			}
-			if err := writer.WriteByte('\n'); err != nil {
-				log.Printf("[ERROR] Failed to write newline: %v", err)
-				return fmt.Errorf("failed to write newline: %w", err)
-			}
 			if err := writer.Flush(); err != nil {
 				log.Printf("[ERROR] Failed to flush writer: %v", err)
 				return fmt.Errorf("failed to flush writer: %w", err)
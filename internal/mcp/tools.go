@@ -18,22 +18,10 @@ func handleToolsList(s *Server, params json.RawMessage) (interface{}, error) {
 		return nil, fmt.Errorf("server not initialized")
 	}
 
-	// Return tool definition
-	tool := s.ToolDefinition()
-
-	// Update tool schema with strict validation
-	inputSchema := tool["inputSchema"].(map[string]interface{})
-	properties := inputSchema["properties"].(map[string]interface{})
-
-	// Add minLength to context
-	context := properties["context"].(map[string]interface{})
-	context["minLength"] = 1
-
-	// Add additionalProperties: false
-	inputSchema["additionalProperties"] = false
-
+	// Return the cached tool definition; the strict schema constraints
+	// (minLength, additionalProperties) are baked in at construction
 	result := map[string]interface{}{
-		"tools": []interface{}{tool},
+		"tools": []interface{}{s.ToolDefinition()},
 	}
 
 	return result, nil
@@ -84,8 +72,7 @@ func handleToolsCall(s *Server, params json.RawMessage) (interface{}, error) {
 	}
 
 	// Check for unknown parameters (tool execution error)
-	allowed := []string{"context", "language", "framework", "verbosity"}
-	if err := validateNoUnknownParams(p.Arguments, allowed); err != nil {
+	if err := validateNoUnknownParams(p.Arguments, allowedToolParams); err != nil {
 		return createToolExecutionErrorResult(err.Error()), nil
 	}
 
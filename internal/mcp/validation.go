@@ -16,6 +16,15 @@ func validateToolName(name string) error {
 // Maximum allowed length for the context parameter (in bytes)
 const maxContextLength = 10000
 
+// Parameter sets for tmkb_query, built once at package init instead of
+// per validation call
+var (
+	allowedToolParams = []string{"context", "language", "framework", "verbosity"}
+	validLanguages    = map[string]bool{"python": true}
+	validFrameworks   = map[string]bool{"flask": true, "any": true}
+	validVerbosities  = map[string]bool{"agent": true, "human": true}
+)
+
 // validateContext validates the context parameter
 func validateContext(context string) error {
 	if strings.TrimSpace(context) == "" {
@@ -33,11 +42,8 @@ func validateLanguage(language string) error {
 		return nil // Optional field
 	}
 
-	validLanguages := []string{"python"}
-	for _, valid := range validLanguages {
-		if language == valid {
-			return nil
-		}
+	if validLanguages[language] {
+		return nil
 	}
 
 	return fmt.Errorf("Invalid language '%s'. Supported languages: python", language)
@@ -49,11 +55,8 @@ func validateFramework(framework string) error {
 		return nil // Optional field
 	}
 
-	validFrameworks := []string{"flask", "any"}
-	for _, valid := range validFrameworks {
-		if framework == valid {
-			return nil
-		}
+	if validFrameworks[framework] {
+		return nil
 	}
 
 	return fmt.Errorf("Invalid framework '%s'. Supported frameworks: flask, any", framework)
@@ -65,11 +68,8 @@ func validateVerbosity(verbosity string) error {
 		return nil // Optional field
 	}
 
-	validVerbosity := []string{"agent", "human"}
-	for _, valid := range validVerbosity {
-		if verbosity == valid {
-			return nil
-		}
+	if validVerbosities[verbosity] {
+		return nil
 	}
 
 	return fmt.Errorf("Invalid verbosity '%s'. Supported values: agent, human", verbosity)
@@ -77,13 +77,15 @@ func validateVerbosity(verbosity string) error {
 
 // validateNoUnknownParams checks for unknown parameters
 func validateNoUnknownParams(args map[string]interface{}, allowed []string) error {
-	allowedMap := make(map[string]bool)
-	for _, key := range allowed {
-		allowedMap[key] = true
-	}
-
 	for key := range args {
-		if !allowedMap[key] {
+		ok := false
+		for _, a := range allowed {
+			if key == a {
+				ok = true
+				break
+			}
+		}
+		if !ok {
 			return fmt.Errorf("Unknown parameter '%s'. Supported parameters: %s", key, strings.Join(allowed, ", "))
 		}
 	}